@@ -1,4 +1,5 @@
 import os
+import re
 import json
 import time
 from openai import OpenAI
@@ -6,16 +7,31 @@ from typing import List, Dict, Any, Optional, Callable
 import textwrap
 from colorama import init, Fore, Style
 
+# tiktoken is optional - fall back to a character-based estimate without it
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 # Initialize colorama for cross-platform colored terminal output
 init()
 
+MODEL = "gpt-4o-mini"
+
+SYSTEM_PROMPT = "You are a futures thinking expert."
+
+WHEEL_TYPES = ["neutral", "positive", "negative", "long_shot"]
+
 class FuturesWheelGenerator:
     def __init__(self, 
                  branch_counts: List[int] = [4, 3, 2, 1],
                  interactive: bool = False,
                  delay_seconds: int = 0,
                  wheel_type: str = "neutral",
-                 temperature: float = 0.7):
+                 temperature: float = 0.7,
+                 context_mode: str = "full",
+                 context_token_budget: int = 150,
+                 context_recent_ancestors: int = 2):
         """
         Initialize the Futures Wheel Generator.
         
@@ -25,6 +41,11 @@ class FuturesWheelGenerator:
             delay_seconds: Delay between API calls (to avoid rate limits)
             wheel_type: Type of futures wheel to generate - "neutral", "positive", "negative", or "long_shot"
             temperature: Temperature setting for OpenAI API (higher = more creative/random)
+            context_mode: How the branch history is passed to prompts - "full" sends the whole
+                          chain, "summary" keeps the most recent ancestors verbatim and replaces
+                          older ones with a cached rolling summary once the budget is exceeded
+            context_token_budget: Maximum tokens for the branch history in "summary" mode
+            context_recent_ancestors: Number of most recent ancestors always kept verbatim
         """
         self.branch_counts = branch_counts
         self.max_depth = len(branch_counts)
@@ -39,11 +60,28 @@ class FuturesWheelGenerator:
         self.business_description = None  # Business description for relevance
         
         # Set wheel type and corresponding temperature
+        self.base_temperature = temperature
         self.wheel_type = wheel_type.lower()
-        if self.wheel_type == "long_shot":
-            self.temperature = 1.0  # Higher temperature for more creative/unusual outcomes
+        self.temperature = self._get_temperature(self.wheel_type)
+        
+        # Context management settings
+        self.context_mode = context_mode.lower()
+        if self.context_mode not in ("full", "summary"):
+            raise ValueError(f"Unknown context mode: {context_mode} (expected 'full' or 'summary')")
+        self.context_token_budget = context_token_budget
+        self.context_recent_ancestors = max(1, context_recent_ancestors)
+        self.summary_cache = {}  # (previous summary, folded ancestors) -> summary text
+        
+        # Token usage statistics for the last generated wheel
+        self.token_usage = {}
+        self._reset_token_usage()
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(MODEL)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("o200k_base")
         else:
-            self.temperature = temperature
+            self._encoding = None
         
     def generate_wheel(self, central_topic: str) -> Dict[str, Any]:
         """
@@ -62,23 +100,79 @@ class FuturesWheelGenerator:
             "topic": central_topic,
             "impacts": [],
             "path": [],  # Empty path for root
-            "branch_text": central_topic  # Track the full branch text
+            "branch_text": central_topic,  # Track the full branch text
+            "context_summary": None,  # Summary of folded ancestors ("summary" mode)
+            "context_tail": [central_topic]  # Ancestors kept verbatim ("summary" mode)
         }
         
+        self._reset_token_usage()
+        
         # Generate the wheel recursively
         self._generate_impacts(wheel, depth=0)
         
+        self._display_token_usage()
+        
         # Remove path keys before returning (they were just for internal use)
         self._clean_wheel(wheel)
         
         return wheel
     
+    def generate_wheels(self, central_topic: str, wheel_types: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate futures wheels of several types for the same central topic in a single pass.
+        
+        The wheels are expanded in lockstep by path, and each node expansion asks for all
+        wheel types that share sampling settings in one structured response. Types that
+        need a different temperature (e.g. "long_shot") get a separate call.
+        
+        Args:
+            central_topic: The central topic/event to explore
+            wheel_types: Wheel types to generate - any of "neutral", "positive", "negative", "long_shot"
+            
+        Returns:
+            A dictionary mapping each wheel type to its futures wheel
+        """
+        wheel_types = [t.lower() for t in wheel_types]
+        if not wheel_types:
+            raise ValueError("At least one wheel type is required")
+        for wheel_type in wheel_types:
+            if wheel_type not in WHEEL_TYPES:
+                raise ValueError(f"Unknown wheel type: {wheel_type} (expected one of {', '.join(WHEEL_TYPES)})")
+        
+        print(f"Generating {', '.join(wheel_types)} futures wheels for: {central_topic}")
+        
+        # Create a root node for each wheel type
+        wheels = {}
+        for wheel_type in wheel_types:
+            wheels[wheel_type] = {
+                "topic": central_topic,
+                "impacts": [],
+                "path": [],
+                "branch_text": central_topic,
+                "context_summary": None,
+                "context_tail": [central_topic]
+            }
+        
+        self._reset_token_usage()
+        
+        # Generate all wheels recursively, one path at a time
+        self._generate_multi_impacts(wheels, depth=0)
+        
+        self._display_token_usage()
+        
+        for wheel in wheels.values():
+            self._clean_wheel(wheel)
+        
+        return wheels
+    
     def _clean_wheel(self, node: Dict[str, Any]) -> None:
         """Remove internal path tracking from the wheel before output"""
         if "path" in node:
             del node["path"]
         if "branch_text" in node:
             del node["branch_text"]
+        node.pop("context_summary", None)
+        node.pop("context_tail", None)
         
         for impact in node.get("impacts", []):
             self._clean_wheel(impact)
@@ -162,8 +256,9 @@ class FuturesWheelGenerator:
                 print("Skipping this branch")
                 return
         
-        # Generate impacts using OpenAI
-        impacts = self._get_impacts_from_openai(branch_text, depth, current_path)
+        # Generate impacts using OpenAI, with the branch history kept within budget
+        prompt_context = self._get_prompt_context(node)
+        impacts = self._get_impacts_from_openai(prompt_context, depth, current_path)
         
         # Add impacts to the current node
         for i, impact in enumerate(impacts):
@@ -177,7 +272,9 @@ class FuturesWheelGenerator:
                 "topic": impact,
                 "impacts": [],
                 "path": new_path,
-                "branch_text": new_branch_text
+                "branch_text": new_branch_text,
+                "context_summary": node.get("context_summary"),
+                "context_tail": node.get("context_tail", [branch_text]) + [impact]
             }
             node["impacts"].append(impact_node)
             
@@ -192,57 +289,447 @@ class FuturesWheelGenerator:
             # Recursively generate impacts for this new node
             self._generate_impacts(impact_node, depth + 1)
     
-    def _get_impacts_from_openai(self, branch_text: str, depth: int, path: List[int]) -> List[str]:
+    def _generate_multi_impacts(self, nodes: Dict[str, Dict[str, Any]], depth: int) -> None:
+        """
+        Recursively generate impacts for the nodes at the same path in several wheels.
+        
+        Args:
+            nodes: The current node of each wheel, keyed by wheel type
+            depth: Current depth in the recursion
+        """
+        # Base case: stop recursion if we've reached max depth
+        if depth >= self.max_depth:
+            return
+        
+        # All nodes share the same path, since the wheels are expanded in lockstep
+        current_path = next(iter(nodes.values())).get("path", [])
+        
+        # If interactive mode, ask for confirmation
+        if self.interactive:
+            for wheel_type, node in nodes.items():
+                print(f"\nCurrent topic ({wheel_type}): {node['topic']}")
+            print(f"Depth: {depth}, Path: {current_path}")
+            proceed = input("Generate impacts for these topics? (y/n): ").lower().strip()
+            if proceed != 'y':
+                print("Skipping this branch")
+                return
+        
+        # Group wheel types by temperature - one call per group
+        groups = {}
+        for wheel_type in nodes:
+            groups.setdefault(self._get_temperature(wheel_type), []).append(wheel_type)
+        
+        impacts_by_type = {}
+        for temperature, wheel_types in groups.items():
+            contexts = {t: self._get_prompt_context(nodes[t]) for t in wheel_types}
+            if len(wheel_types) == 1:
+                wheel_type = wheel_types[0]
+                impacts_by_type[wheel_type] = self._get_impacts_from_openai(
+                    contexts[wheel_type], depth, current_path, wheel_type=wheel_type)
+            else:
+                impacts_by_type.update(
+                    self._get_multi_impacts_from_openai(contexts, depth, current_path, temperature))
+        
+        # Every wheel has the same branch count, so children can be paired by index
+        for i in range(self.branch_counts[depth]):
+            new_path = current_path + [i]
+            children = {}
+            
+            for wheel_type, node in nodes.items():
+                impact = impacts_by_type[wheel_type][i]
+                branch_text = node.get("branch_text", node["topic"])
+                impact_node = {
+                    "topic": impact,
+                    "impacts": [],
+                    "path": new_path,
+                    "branch_text": f"{branch_text} -> {impact}",
+                    "context_summary": node.get("context_summary"),
+                    "context_tail": node.get("context_tail", [branch_text]) + [impact]
+                }
+                node["impacts"].append(impact_node)
+                children[wheel_type] = impact_node
+                
+                # Show progress
+                indent = "  " * (depth + 1)
+                print(f"{indent}Processing ({wheel_type}): {impact} (Path: {new_path})")
+            
+            # Add delay to avoid rate limits if specified
+            if self.delay_seconds > 0:
+                time.sleep(self.delay_seconds)
+            
+            # Recursively generate impacts for the new nodes
+            self._generate_multi_impacts(children, depth + 1)
+    
+    def _get_impacts_from_openai(self, branch_text: str, depth: int, path: List[int],
+                                 wheel_type: Optional[str] = None) -> List[str]:
         """
         Use OpenAI to generate impacts for a given topic.
         
         Args:
-            branch_text: The full branch text to generate impacts for
+            branch_text: The branch text to generate impacts for (summarized in "summary" mode)
             depth: Current depth in the recursion
             path: Current path in the tree
+            wheel_type: Wheel type to generate impacts for (defaults to the generator's wheel type)
             
         Returns:
             List of impact statements
         """
+        wheel_type = wheel_type or self.wheel_type
+        
         # Get the appropriate prompt for this path and depth, with wheel type applied
-        prompt = self._get_prompt_for_path(path, depth, branch_text)
+        prompt = self._get_prompt_for_path(path, depth, branch_text, wheel_type)
         
         # Display the prompt in a visually appealing way
         self._display_prompt(prompt, path, depth)
         
         # Call OpenAI API
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=MODEL,
             response_format={"type": "json_object"},
-            temperature=self.temperature,
+            temperature=self._get_temperature(wheel_type),
             messages=[
-                {"role": "system", "content": "You are a futures thinking expert."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ]
         )
+        self._record_token_usage("impacts", prompt, response)
         
         # Extract and return the impacts
         try:
             content = response.choices[0].message.content
             impacts_data = json.loads(content)
             impacts = impacts_data.get("impacts", [])
-            
-            # Ensure we get exactly the number of impacts we want
-            branch_count = self.branch_counts[depth]
-            if len(impacts) > branch_count:
-                impacts = impacts[:branch_count]
-            elif len(impacts) < branch_count:
-                # Pad with placeholder impacts if we didn't get enough
-                impacts.extend([f"Impact {i+1} for {branch_text}" for i in range(len(impacts), branch_count)])
-                
-            return impacts
+            return self._fit_impacts(impacts, depth, branch_text)
         except (json.JSONDecodeError, KeyError, AttributeError) as e:
             print(f"Error parsing OpenAI response: {e}")
             print(f"Response content: {response.choices[0].message.content}")
             # Return placeholder impacts on error
             return [f"Error generating impact {i+1}" for i in range(self.branch_counts[depth])]
+    
+    def _get_multi_impacts_from_openai(self, contexts: Dict[str, str], depth: int, path: List[int],
+                                       temperature: float) -> Dict[str, List[str]]:
+        """
+        Use OpenAI to generate impacts for several wheel types in one call.
+        
+        Args:
+            contexts: The branch text for each wheel type at this path
+            depth: Current depth in the recursion
+            path: Current path in the tree
+            temperature: Temperature shared by all of the wheel types
+            
+        Returns:
+            Dictionary mapping each wheel type to its list of impact statements
+        """
+        # Build one prompt per wheel type and combine them into a single request,
+        # dropping each section's own output format in favour of the combined one
+        sections = []
+        for wheel_type, branch_text in contexts.items():
+            type_prompt = self._get_prompt_for_path(path, depth, branch_text, wheel_type)
+            type_prompt = re.sub(r"Provide only the impacts as a JSON array of strings\.\s*", "", type_prompt)
+            sections.append(f'Request "{wheel_type}":\n{textwrap.dedent(type_prompt).strip()}')
+        keys = ", ".join(f'"{t}"' for t in contexts)
+        header = textwrap.dedent("""
+        Answer each of the following requests independently.
+        Ignore any output format given within a request and use the format described at the end.
+        """).strip()
+        trailer = textwrap.dedent(f"""
+        Provide the result as a single JSON object with the keys {keys},
+        each mapping to a JSON array of strings with the impacts for that request.
+        """).strip()
+        prompt = header + "\n\n" + "\n\n".join(sections) + "\n\n" + trailer
+        
+        # Display the prompt in a visually appealing way
+        self._display_prompt(prompt, path, depth)
+        
+        # Call OpenAI API
+        response = client.chat.completions.create(
+            model=MODEL,
+            response_format={"type": "json_object"},
+            temperature=temperature,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ]
+        )
+        self._record_token_usage("impacts", prompt, response)
+        
+        # Extract and split the impacts by wheel type
+        content = response.choices[0].message.content
+        try:
+            impacts_data = json.loads(content)
+            if not isinstance(impacts_data, dict):
+                raise TypeError(f"expected a JSON object, got {type(impacts_data).__name__}")
+        except (json.JSONDecodeError, TypeError) as e:
+            print(f"Error parsing OpenAI response: {e}")
+            print(f"Response content: {content}")
+            impacts_data = {}
+        
+        return {
+            wheel_type: self._parse_type_impacts(impacts_data, wheel_type, depth, branch_text)
+            for wheel_type, branch_text in contexts.items()
+        }
+    
+    def _parse_type_impacts(self, impacts_data: Dict[str, Any], wheel_type: str,
+                            depth: int, branch_text: str) -> List[str]:
+        """
+        Get the impacts for one wheel type from a combined response, falling back to
+        placeholders for that type only if its value is missing or malformed.
+        
+        Args:
+            impacts_data: The parsed JSON object from the combined response
+            wheel_type: The wheel type to extract
+            depth: Current depth in the recursion
+            branch_text: The branch text the impacts were generated for
+            
+        Returns:
+            List of impact statements
+        """
+        impacts = impacts_data.get(wheel_type)
+        
+        # Unwrap {"impacts": [...]}, which the model may return for each request
+        if isinstance(impacts, dict):
+            impacts = impacts.get("impacts")
+        
+        if not isinstance(impacts, list) or not all(isinstance(impact, str) for impact in impacts):
+            if impacts_data:
+                print(f"Error parsing {wheel_type} impacts from OpenAI response: {impacts!r}")
+            # Return placeholder impacts on error
+            return [f"Error generating impact {i+1}" for i in range(self.branch_counts[depth])]
+        
+        return self._fit_impacts(impacts, depth, branch_text)
+    
+    def _fit_impacts(self, impacts: List[str], depth: int, branch_text: str) -> List[str]:
+        """
+        Ensure we get exactly the number of impacts we want for this depth.
+        
+        Args:
+            impacts: Impacts returned by OpenAI
+            depth: Current depth in the recursion
+            branch_text: The branch text the impacts were generated for
+            
+        Returns:
+            List of exactly branch_counts[depth] impact statements
+        """
+        branch_count = self.branch_counts[depth]
+        if len(impacts) > branch_count:
+            impacts = impacts[:branch_count]
+        elif len(impacts) < branch_count:
+            # Pad with placeholder impacts if we didn't get enough
+            impacts.extend([f"Impact {i+1} for {branch_text}" for i in range(len(impacts), branch_count)])
+        return impacts
+    
+    def _get_temperature(self, wheel_type: str) -> float:
+        """
+        Get the sampling temperature for a wheel type.
+        
+        Args:
+            wheel_type: The wheel type
+            
+        Returns:
+            Temperature setting for OpenAI API
+        """
+        if wheel_type == "long_shot":
+            return 1.0  # Higher temperature for more creative/unusual outcomes
+        return self.base_temperature
+
+    def _get_prompt_context(self, node: Dict[str, Any]) -> str:
+        """
+        Get the branch history to use as {topic} in the prompt for a node.
+        
+        In "full" mode this is the complete branch text. In "summary" mode, once the
+        history exceeds the token budget, older ancestors are folded into a summary
+        that is stored on the node so all of its descendants reuse it. If that is still
+        over budget, only the newest ancestor is kept verbatim and the summary is
+        truncated to fit. The newest ancestor itself is never shortened.
+        
+        Args:
+            node: The node to build the prompt context for
+            
+        Returns:
+            The branch history text
+        """
+        if self.context_mode == "full":
+            return node.get("branch_text", node["topic"])
+        
+        summary = node.get("context_summary")
+        tail = node.get("context_tail", [node["topic"]])
+        context = self._format_context(summary, tail)
+        
+        # Fold down to the recent ancestors first, then to the newest one if still over budget
+        for keep in (self.context_recent_ancestors, 1):
+            if self.count_tokens(context) <= self.context_token_budget or len(tail) <= keep:
+                continue
+            summary = self._summarize_ancestors(summary, tail[:-keep])
+            tail = tail[-keep:]
+            context = self._format_context(summary, tail)
+        
+        # As a last resort, truncate the summary to whatever budget the verbatim ancestor leaves
+        if summary and self.count_tokens(context) > self.context_token_budget:
+            available = self.context_token_budget - self.count_tokens(self._format_context("", tail))
+            summary = self._truncate_to_tokens(summary, available - 5)  # Leave room for the brackets
+            context = self._format_context(summary, tail)
+        
+        # Store on the node so children inherit the summary instead of recomputing it
+        node["context_summary"] = summary
+        node["context_tail"] = tail
+        
+        return context
+    
+    def _format_context(self, summary: Optional[str], tail: List[str]) -> str:
+        """
+        Combine a summary of older ancestors and the recent ancestors into branch text.
+        
+        Args:
+            summary: Summary of the folded ancestors, or None
+            tail: Recent ancestors kept verbatim
+            
+        Returns:
+            The branch history text
+        """
+        chain = " -> ".join(tail)
+        if summary:
+            return f"[Earlier chain: {summary}] -> {chain}"
+        return chain
+    
+    def _summarize_ancestors(self, summary: Optional[str], ancestors: List[str]) -> str:
+        """
+        Summarize older ancestors (and any previous summary) into a short text.
+        Results are cached, so each subtree is summarized only once.
+        
+        Args:
+            summary: Previous summary of even older ancestors, or None
+            ancestors: Ancestors to fold into the summary
+            
+        Returns:
+            Summary text
+        """
+        cache_key = (summary, tuple(ancestors))
+        if cache_key in self.summary_cache:
+            return self.summary_cache[cache_key]
+        
+        chain = self._format_context(summary, ancestors)
+        prompt = f"""
+        Summarize this chain of consequences in one sentence of 30 words or less,
+        preserving the causal order and the key ideas: "{chain}"
+        Provide only the summary as a JSON object with a "summary" string.
+        """
+        
+        response = client.chat.completions.create(
+            model=MODEL,
+            response_format={"type": "json_object"},
+            temperature=0.0,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ]
+        )
+        self._record_token_usage("summary", prompt, response)
+        
+        try:
+            content = response.choices[0].message.content
+            new_summary = json.loads(content)["summary"]
+            if not isinstance(new_summary, str) or not new_summary.strip():
+                raise TypeError(f"expected a non-empty string summary, got {new_summary!r}")
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            print(f"Error parsing summary response: {e}")
+            # Fall back to the start of the chain, truncated to half the budget; not cached,
+            # so the next fold in this subtree tries summarizing again
+            flat_chain = " -> ".join(([summary] if summary else []) + ancestors)
+            return self._truncate_to_tokens(flat_chain, self.context_token_budget // 2)
+        
+        self.summary_cache[cache_key] = new_summary
+        return new_summary
+    
+    def count_tokens(self, text: str) -> int:
+        """
+        Count the tokens in a piece of text. Uses tiktoken when installed,
+        otherwise estimates roughly 4 characters per token.
+        
+        Args:
+            text: The text to count
+            
+        Returns:
+            Number of tokens
+        """
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return (len(text) + 3) // 4
+    
+    def count_message_tokens(self, prompt: str) -> int:
+        """
+        Count the prompt tokens of a chat request, as reported by the API: the system
+        and user messages plus the chat framing (about 3 tokens per message, and 3
+        for priming the reply).
+        
+        Args:
+            prompt: The user prompt sent with the system prompt
+            
+        Returns:
+            Number of prompt tokens
+        """
+        messages = [SYSTEM_PROMPT, prompt]
+        return sum(self.count_tokens(content) + 3 for content in messages) + 3
+    
+    def _truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate text to at most max_tokens tokens, marking the cut with "...".
+        
+        Args:
+            text: The text to truncate
+            max_tokens: Maximum number of tokens to keep
+            
+        Returns:
+            The truncated text
+        """
+        if self.count_tokens(text) <= max_tokens:
+            return text
+        max_tokens = max(1, max_tokens - 1)  # Leave room for the ellipsis
+        if self._encoding is not None:
+            return self._encoding.decode(self._encoding.encode(text)[:max_tokens]).rstrip() + "..."
+        return text[:max_tokens * 4].rstrip() + "..."
+    
+    def _reset_token_usage(self) -> None:
+        """Reset the token usage statistics"""
+        self.token_usage = {
+            "impact_calls": 0,
+            "impact_prompt_tokens": 0,
+            "summary_calls": 0,
+            "summary_prompt_tokens": 0,
+            "completion_tokens": 0
+        }
+    
+    def _record_token_usage(self, kind: str, prompt: str, response: Any) -> None:
+        """
+        Record the tokens used by an API call. Uses the usage reported by the API
+        when available, otherwise counts the same messages locally.
+        
+        Args:
+            kind: "impacts" or "summary"
+            prompt: The user prompt that was sent
+            response: The OpenAI API response
+        """
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        if prompt_tokens is None:
+            prompt_tokens = self.count_message_tokens(prompt)
+        
+        prefix = "impact" if kind == "impacts" else "summary"
+        self.token_usage[f"{prefix}_calls"] += 1
+        self.token_usage[f"{prefix}_prompt_tokens"] += prompt_tokens
+        self.token_usage["completion_tokens"] += getattr(usage, "completion_tokens", None) or 0
+    
+    def _display_token_usage(self) -> None:
+        """Print the token usage statistics for the last generated wheel"""
+        usage = self.token_usage
+        total_prompt = usage["impact_prompt_tokens"] + usage["summary_prompt_tokens"]
+        print(f"\n{Fore.CYAN}Token usage ({self.context_mode} context):{Style.RESET_ALL}")
+        print(f"  Impact calls: {usage['impact_calls']}, prompt tokens: {usage['impact_prompt_tokens']}")
+        if self.context_mode == "summary":
+            print(f"  Summary calls: {usage['summary_calls']}, prompt tokens: {usage['summary_prompt_tokens']}")
+        print(f"  Total prompt tokens: {total_prompt}, completion tokens: {usage['completion_tokens']}")
 
-    def _get_prompt_for_path(self, path: List[int], depth: int, branch_text: str) -> str:
+    def _get_prompt_for_path(self, path: List[int], depth: int, branch_text: str,
+                             wheel_type: Optional[str] = None) -> str:
         """
         Get the appropriate prompt for the given path and depth, with wheel type applied.
         
@@ -250,6 +737,7 @@ class FuturesWheelGenerator:
             path: Current path in the tree
             depth: Current depth in the recursion
             branch_text: The full branch text to generate impacts for
+            wheel_type: Wheel type to apply (defaults to the generator's wheel type)
             
         Returns:
             Prompt string
@@ -283,13 +771,14 @@ class FuturesWheelGenerator:
                 )
         
         # Apply wheel type modifications to the prompt
-        if self.wheel_type == "positive":
+        wheel_type = wheel_type or self.wheel_type
+        if wheel_type == "positive":
             prompt = prompt.replace("potential impacts or consequences", 
                                    "potential POSITIVE impacts or consequences (benefits, opportunities, advantages)")
-        elif self.wheel_type == "negative":
+        elif wheel_type == "negative":
             prompt = prompt.replace("potential impacts or consequences", 
                                    "potential NEGATIVE impacts or consequences (risks, challenges, disadvantages)")
-        elif self.wheel_type == "long_shot":
+        elif wheel_type == "long_shot":
             prompt = prompt.replace("potential impacts or consequences", 
                                    "potential UNUSUAL or SURPRISING impacts or consequences (low-probability but high-impact)")
         
@@ -1,5 +1,5 @@
 import argparse
-from FuturesWheelGenerator import FuturesWheelGenerator
+from FuturesWheelGenerator import FuturesWheelGenerator, WHEEL_TYPES
 
 def main():
     # Set up argument parser
@@ -16,12 +16,32 @@ def main():
     parser.add_argument('--type', type=str, choices=['neutral', 'positive', 'negative', 'long_shot'], 
                         default='neutral',
                         help='Type of futures wheel to generate (neutral, positive, negative, or long_shot)')
+    parser.add_argument('--types', type=str, default=None,
+                        help='Comma-separated list of wheel types to generate in a single pass (e.g. neutral,positive,negative,long_shot). '
+                             'Each wheel is saved as <output>_<type>. Overrides --type')
     parser.add_argument('--temperature', type=float, default=0.7,
                         help='Temperature setting for OpenAI API (higher = more creative/random)')
+    parser.add_argument('--context-mode', type=str, choices=['full', 'summary'], default='full',
+                        help='Pass the full branch history to prompts, or summarize older ancestors to stay within a token budget')
+    parser.add_argument('--context-budget', type=int, default=150,
+                        help='Maximum tokens for the branch history in summary mode (default: 150)')
+    parser.add_argument('--context-recent', type=int, default=2,
+                        help='Number of most recent ancestors kept verbatim in summary mode (default: 2)')
     
     # Parse arguments
     args = parser.parse_args()
     
+    # Validate wheel types for multi-perspective mode
+    wheel_types = None
+    if args.types is not None:
+        wheel_types = [t.strip().lower() for t in args.types.split(',') if t.strip()]
+        if not wheel_types:
+            parser.error("argument --types: expected at least one wheel type")
+        unknown = [t for t in wheel_types if t not in WHEEL_TYPES]
+        if unknown:
+            parser.error(f"argument --types: invalid choice(s): {', '.join(unknown)} "
+                         f"(choose from {', '.join(WHEEL_TYPES)})")
+    
     # Parse branch counts
     branch_counts = [int(x) for x in args.branches.split(',')]
     
@@ -31,9 +51,24 @@ def main():
         interactive=args.interactive,
         delay_seconds=args.delay,
         wheel_type=args.type,
-        temperature=args.temperature
+        temperature=args.temperature,
+        context_mode=args.context_mode,
+        context_token_budget=args.context_budget,
+        context_recent_ancestors=args.context_recent
     )
     
+    # Multi-perspective mode: generate all requested wheel types in one pass
+    if wheel_types:
+        wheels = generator.generate_wheels(args.topic, wheel_types)
+        
+        for wheel_type, wheel in wheels.items():
+            output = f"{args.output}_{wheel_type}"
+            generator.save_wheel(wheel, output)
+            print(f"\nFutures wheel saved to {output}.puml")
+        
+        print("To view the diagrams, use a PlantUML viewer or online service like http://www.plantuml.com/plantuml/")
+        return
+    
     print(f"Generating {args.type} futures wheel for: {args.topic}")
     
     # Generate the wheel